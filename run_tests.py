@@ -1,12 +1,23 @@
 #!/usr/bin/env python
-"""Quick test runner script"""
+"""Quick test runner script
 
-import subprocess
+Extra arguments are passed through to pytest, e.g. ``python run_tests.py -v``.
+"""
+
+import os
 import sys
 
-result = subprocess.run(
-    [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"],
-    cwd="/workspaces/skills-getting-started-with-github-copilot"
-)
+import pytest
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-sys.exit(result.returncode)
+sys.exit(pytest.main([
+    "tests/",
+    "--tb=short",
+    "-p", "no:cacheprovider",
+    "-p", "no:warnings",
+    "--import-mode=importlib",
+    "-n", "auto",
+    "--dist=load",
+    *sys.argv[1:],
+]))
@@ -5,38 +5,76 @@ These tests verify the functionality of the FastAPI application for managing
 extracurricular activities and student signups.
 """
 
+import asyncio
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-from src.app import app
+from src.app import app, activities
+
+# Built once at import so app setup is never repeated per test
+_APP_CLIENT = TestClient(app)
 
+_EXPECTED_ACTIVITIES = frozenset({"Chess Club", "Basketball", "Programming Class"})
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client for the FastAPI app, shared across the session"""
+    with _APP_CLIENT as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def async_client(anyio_backend):
+    """Create a single async client for the FastAPI app, shared across the session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(autouse=True)
+def _isolate_state():
+    """Restore activity participants after each test so tests stay independent"""
+    snapshot = {name: list(details["participants"])
+                for name, details in activities.items()}
+    yield
+    for name, details in activities.items():
+        details["participants"] = snapshot[name]
+
+
+@pytest.fixture(scope="session")
+def initial_activities(client):
+    """Fetch and parse the initial activities list once for read-only assertions
+
+    Safe to share because _isolate_state restores the data after every test.
+    """
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
 
 
 class TestActivities:
     """Test cases for activities endpoints"""
 
-    def test_get_activities(self, client):
+    def test_get_activities(self, initial_activities):
         """Test retrieving all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        
-        data = response.json()
+        data = initial_activities
         assert isinstance(data, dict)
         assert len(data) > 0
         
-        # Verify at least one expected activity exists
-        assert "Chess Club" in data
-        assert "Basketball" in data
-        assert "Programming Class" in data
+        # Verify the expected activities exist
+        assert _EXPECTED_ACTIVITIES <= data.keys()
 
-    def test_activity_structure(self, client):
+    def test_activity_structure(self, initial_activities):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
+        data = initial_activities
         
         # Check Chess Club structure
         chess_club = data["Chess Club"]
@@ -46,15 +84,13 @@ class TestActivities:
         assert "participants" in chess_club
         assert isinstance(chess_club["participants"], list)
 
-    def test_activities_have_participants(self, client):
+    def test_activities_have_participants(self, initial_activities):
         """Test that some activities have existing participants"""
-        response = client.get("/activities")
-        data = response.json()
+        data = initial_activities
         
         # Verify at least one activity has participants
         has_participants = any(
-            len(activity["participants"]) > 0 
-            for activity in data.values()
+            activity["participants"] for activity in data.values()
         )
         assert has_participants, "At least one activity should have participants"
 
@@ -77,23 +113,6 @@ class TestSignup:
         assert "message" in data
         assert email in data["message"]
 
-    def test_signup_appears_in_activity(self, client):
-        """Test that signed up student appears in the activity participants list"""
-        email = "new.student@mergington.edu"
-        activity = "Debate Team"
-        
-        # Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        assert signup_response.status_code == 200
-        
-        # Verify in activities list
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert email in data[activity]["participants"]
-
     def test_duplicate_signup_rejected(self, client):
         """Test that duplicate signup is rejected"""
         email = "michael@mergington.edu"  # Already signed up for Chess Club
@@ -105,8 +124,7 @@ class TestSignup:
         )
         
         assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"].lower()
+        assert b"already signed up" in response.content.lower()
 
     def test_signup_nonexistent_activity(self, client):
         """Test that signup for non-existent activity fails"""
@@ -119,28 +137,29 @@ class TestSignup:
         )
         
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        assert b"not found" in response.content.lower()
 
-    def test_signup_multiple_activities(self, client):
+    @pytest.mark.anyio
+    async def test_signup_multiple_activities(self, async_client):
         """Test that a student can sign up for multiple activities"""
         email = "multi.student@mergington.edu"
         
-        # Sign up for two different activities
-        response1 = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
+        # Sign up for two different activities concurrently
+        response1, response2 = await asyncio.gather(
+            async_client.post(
+                "/activities/Chess Club/signup",
+                params={"email": email}
+            ),
+            async_client.post(
+                "/activities/Basketball/signup",
+                params={"email": email}
+            ),
         )
         assert response1.status_code == 200
-        
-        response2 = client.post(
-            "/activities/Basketball/signup",
-            params={"email": email}
-        )
         assert response2.status_code == 200
         
         # Verify both signups
-        activities_response = client.get("/activities")
+        activities_response = await async_client.get("/activities")
         data = activities_response.json()
         assert email in data["Chess Club"]["participants"]
         assert email in data["Basketball"]["participants"]
@@ -149,47 +168,30 @@ class TestSignup:
 class TestUnregister:
     """Test cases for student unregister endpoints"""
 
-    def test_unregister_from_activity(self, client):
-        """Test unregistering a student from an activity"""
-        email = "test.unregister@mergington.edu"
-        activity = "Science Club"
-        
-        # First, sign up
+    @pytest.mark.parametrize("activity,email", [
+        ("Science Club", "test.unregister@mergington.edu"),
+        ("Tennis", "temp.student@mergington.edu"),
+    ])
+    def test_signup_unregister_roundtrip(self, client, activity, email):
+        """Test that a student can sign up and then be unregistered from an activity"""
+        # Sign up
         signup_response = client.post(
             f"/activities/{activity}/signup",
             params={"email": email}
         )
         assert signup_response.status_code == 200
         
-        # Then unregister
-        unregister_response = client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
-        assert unregister_response.status_code == 200
-        data = unregister_response.json()
-        assert data["success"] is True
-
-    def test_unregistered_student_not_in_participants(self, client):
-        """Test that unregistered student is removed from participants"""
-        email = "temp.student@mergington.edu"
-        activity = "Tennis"
-        
-        # Sign up
-        client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        
         # Verify signup
         response = client.get("/activities")
         assert email in response.json()[activity]["participants"]
         
         # Unregister
-        client.delete(
+        unregister_response = client.delete(
             f"/activities/{activity}/unregister",
             params={"email": email}
         )
+        assert unregister_response.status_code == 200
+        assert unregister_response.json()["success"] is True
         
         # Verify removal
         response = client.get("/activities")
@@ -206,8 +208,7 @@ class TestUnregister:
         )
         
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        assert b"not found" in response.content.lower()
 
     def test_unregister_nonexistent_student(self, client):
         """Test that unregistering non-existent student fails"""
@@ -220,8 +221,7 @@ class TestUnregister:
         )
         
         assert response.status_code == 400
-        data = response.json()
-        assert "not registered" in data["detail"].lower()
+        assert b"not registered" in response.content.lower()
 
 
 class TestRootRedirect:
@@ -229,6 +229,12 @@ class TestRootRedirect:
 
     def test_root_redirects_to_static(self, client):
         """Test that root endpoint redirects to static HTML"""
+        response = client.get("/", follow_redirects=False)
+        assert response.status_code in (301, 302, 307, 308)
+        assert response.headers["location"] == "/static/index.html"
+
+    def test_static_index_served(self, client):
+        """Test that following the root redirect serves the HTML page"""
         response = client.get("/", follow_redirects=True)
         assert response.status_code == 200
         # The response should contain HTML content